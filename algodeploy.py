@@ -13,43 +13,216 @@ Options:
   --version     Show version.
 """
 from docopt import docopt
-import urllib.request
 from tqdm import tqdm
 from pathlib import Path
 import platform
 import requests
-import re
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import tarfile
 import shutil
 import subprocess
 import sys
 import json
+import asyncio
+import shlex
+import os
+import time
+import hashlib
+import gzip
+import io
+import itertools
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from yaspin import yaspin
 
-# https://stackoverflow.com/a/53877507
-class DownloadProgressBar(tqdm):
-    def update_to(self, b=1, bsize=1, tsize=None):
-        if tsize is not None:
-            self.total = tsize
-        self.update(b * bsize - self.n)
+try:
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+DOWNLOAD_WORKERS = 8
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MiB per ranged request
+DOWNLOAD_BLOCK_SIZE = 1024 * 1024  # 1 MiB per write
+TAR_COPY_BUFSIZE = 2 * 1024 * 1024  # tarfile defaults to 16 KiB copies
+STREAM_READ_SIZE = 256 * 1024  # Read buffer between the socket and gzip
+CMD_READ_SIZE = 64 * 1024  # Largest read of command output
+STREAM_QUEUE_CHUNKS = 8  # Chunks buffered between each stage of a streamed extraction
+EXTRACT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+EXTRACT_MAX_IN_FLIGHT_MIB = 256  # Upper bound on file data buffered for writer threads
+
+NODE_BINARIES = ("algod", "goal", "kmd")
+
+# Set file metadata through the open descriptor, skipping a path lookup per call
+FD_METADATA = os.chmod in os.supports_fd and os.utime in os.supports_fd
+
+# The "data" filter rejects members that would land outside the destination. Older Pythons
+# without extraction filters keep the unfiltered behaviour
+TAR_EXTRACT_FILTER = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+FICLONE = 0x40049409  # Linux ioctl that shares extents between files (btrfs, xfs)
+
+# Local archives use zstd when available. The algodeploy mirror only has gzipped archives
+ARCHIVE_SUFFIX = ".tar.gz" if zstandard is None else ".tar.zst"
+
+
+def json_loads(data):
+    """
+    Parse JSON from str or bytes, with orjson when it's installed
+    """
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def json_dumps(data):
+    """
+    Serialize data to JSON bytes indented by 4 spaces. orjson can only indent by 2, so the
+    stdlib is always used to keep written files the same whether or not orjson is installed
+    """
+    return json.dumps(data, indent=4).encode()
+
+
+class ThreadedReader(io.RawIOBase):
+    """
+    A readable stream of the byte chunks produced by an iterator, which is consumed on a
+    background thread so that producing the next chunks overlaps with reading the current ones
+    """
+
+    def __init__(self, chunks, maxsize=STREAM_QUEUE_CHUNKS):
+        self.queue = queue.Queue(maxsize)
+        self.pending = memoryview(b"")
+        self.eof = False
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.fill, args=(chunks,), daemon=True)
+        self.thread.start()
+
+    def fill(self, chunks):
+        try:
+            for chunk in chunks:
+                if self.stopped.is_set():
+                    return
+                if chunk:
+                    self.queue.put(chunk)
+            item = None
+        except Exception as e:
+            item = e
+        # None marks the end of the stream, and an exception is raised by the reader
+        if not self.stopped.is_set():
+            self.queue.put(item)
+
+    def drain(self):
+        while True:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                return
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self.pending:
+            if self.eof:
+                return 0
+            item = self.queue.get()
+            if item is None:
+                self.eof = True
+                return 0
+            if isinstance(item, Exception):
+                raise item
+            self.pending = memoryview(item)
+
+        n = min(len(b), len(self.pending))
+        b[:n] = self.pending[:n]
+        self.pending = self.pending[n:]
+        return n
+
+    def close(self):
+        """
+        Stop the background thread and wait for it, so it's no longer using the iterator once
+        this returns. Whatever the iterator reads from can then be closed safely
+        """
+        if not self.closed:
+            self.stopped.set()
+            # Make room for a put the thread may be blocked on, so it sees stopped and returns
+            self.drain()
+            self.thread.join()
+            # Wake a reader blocked on another thread with the end of the stream
+            self.drain()
+            self.queue.put(None)
+        super().close()
+
+
+class RangeIgnoredError(IOError):
+    """
+    Raised when a server answers a ranged request with something other than the requested range
+    """
 
 
 class AlgoDeploy:
     def __init__(self):
         self.home_dir = Path.home()
-        self.algodeploy_dir = Path.joinpath(self.home_dir, ".algodeploy")
-        self.download_dir = Path.joinpath(self.algodeploy_dir, "downloads")
-        self.localnet_dir = Path.joinpath(self.algodeploy_dir, "localnet")
-        self.data_dir = Path.joinpath(self.localnet_dir, "data", "Node")
-        self.bin_dir = Path.joinpath(self.localnet_dir, "bin")
-        self.msys_dir = Path.joinpath(self.home_dir, "msys64")
+        self.algodeploy_dir = self.home_dir / ".algodeploy"
+        self.download_dir = self.algodeploy_dir / "downloads"
+        self.localnet_dir = self.algodeploy_dir / "localnet"
+        self.data_dir = self.localnet_dir / "data" / "Node"
+        self.bin_dir = self.localnet_dir / "bin"
+        self.msys_dir = self.home_dir / "msys64"
+        self.cache_dir = self.algodeploy_dir / "cache"
+        self.archive_dir = self.algodeploy_dir / "archives"
+        self.kmd_dir = self.data_dir / "kmd-v0.5"
+        system = platform.system()
+        machine = platform.machine().lower()
+        if machine == "x86_64":
+            machine = "amd64"
+        self.is_windows = system == "Windows"
+        self.platform_tag = f"{system.lower()}-{machine}"  # For example: linux-amd64
+        # Asset name to sha256 digest for the release found by get_version
+        self.release_digests = {}
+        self.msys_env = None  # Built on the first msys_cmd
+
+        # goal is run many times during create(), so build its argv prefix once
+        goal_name = "goal.exe" if self.is_windows else "goal"
+        self.goal_bin = str(self.bin_dir / goal_name)
+        self.data_dir_str = str(self.data_dir)
+
+        # Share connections between the GitHub API, release and S3 requests
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = "algodeploy/0.1.0"
+        self.session.headers["Accept-Encoding"] = "gzip, deflate"
+        # Retry failed connections with a short backoff rather than falling back to another source
+        retry = Retry(total=3, backoff_factor=0.3)
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry),
+        )
 
     def config(self):
-        kmd_dir = list(self.data_dir.glob("kmd-*"))[0]
-        kmd_config = Path.joinpath(kmd_dir, "kmd_config.json")
+        # kmd only creates its directory on first start, so create it up front.
+        # kmd refuses to use a data directory that other users can read
+        self.kmd_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        kmd_config = self.kmd_dir / "kmd_config.json"
         self.update_json(kmd_config, address="0.0.0.0:4002", allowed_origins=["*"])
 
-        algod_config = Path.joinpath(self.data_dir, "config.json")
+        algod_config = self.data_dir / "config.json"
         self.update_json(
             algod_config,
             EndpointAddress="0.0.0.0:4001",
@@ -58,24 +231,28 @@ class AlgoDeploy:
             IsIndexerActive=False,
         )
 
-        token = "a" * 64
-        with open(Path.joinpath(kmd_dir, "kmd.token"), "w") as f:
-            f.write(token)
-        with open(Path.joinpath(self.data_dir, "algod.token"), "w") as f:
-            f.write(token)
+        token = b"a" * 64
+        self.replace_file(self.kmd_dir / "kmd.token", token, mode=0o600)
+        self.replace_file(self.data_dir / "algod.token", token, mode=0o600)
 
     def stop(self, silent=False):
-        self.goal("node stop", exit_on_error=False, silent=silent)
-        self.goal("kmd stop", exit_on_error=False, silent=silent)
+        # algod and kmd write pid files while running, so skip starting goal for daemons that aren't
+        goal_args = []
+        if (self.data_dir / "algod.pid").exists():
+            goal_args.append("node stop")
+        if (self.kmd_dir / "kmd.pid").exists():
+            goal_args.append("kmd stop")
+
+        if goal_args:
+            self.parallel_goals(*goal_args, exit_on_error=False, silent=silent)
 
     def start(self):
-        self.goal("node start")
-        self.goal("kmd start -t 0")
+        self.parallel_goals("node start", "kmd start -t 0")
 
     def parse_args(self, args=sys.argv[1:]):
         # Handle goal seperately to avoid conflicts with docopt on --help and --version
         if args[0] == "goal":
-            self.goal(" ".join(args[1:]))
+            self.goal(args[1:])
             return
 
         arguments = docopt(__doc__, args, version="algodeploy 0.1.0")
@@ -92,63 +269,214 @@ class AlgoDeploy:
             self.goal("node status")
 
     def update_json(self, file, **kwargs):
-        if Path.exists(file):
-            with open(file, "r+") as f:
-                data = json.load(f)
-                data = {**data, **kwargs}
-                f.seek(0)
-                json.dump(data, f, indent=4)
-                f.truncate()
-        else:
-            with open(file, "w+") as f:
-                json.dump(kwargs, f, indent=4)
-                f.truncate()
+        try:
+            with open(file, "rb") as f:
+                data = {**json_loads(f.read()), **kwargs}
+        except FileNotFoundError:
+            data = kwargs
+
+        self.replace_file(file, json_dumps(data))
+
+    def replace_file(self, path, data, mode=0o666):
+        """
+        Write data to a temporary file and rename it over path, so a crash can't leave a partial file.
+        Raw os calls are used since the files are small and written in one go
+        """
+        tmp = path.with_name(f"{path.name}.tmp")
+        fd = os.open(
+            tmp,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+            mode,
+        )
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+
+    def goal_argv(self, args):
+        """
+        Build the argv for a goal command. args may be a string or a list of arguments
+        """
+        if isinstance(args, str):
+            args = shlex.split(args)
+        return [self.goal_bin, "-d", self.data_dir_str, *args]
 
     def goal(self, args, exit_on_error=True, silent=False):
-        goal_path = Path.joinpath(self.bin_dir, "goal")
+        self.cmd(self.goal_argv(args), exit_on_error, silent)
 
-        if platform.system() == "Windows":
-            goal_path = Path.joinpath(self.bin_dir, "goal.exe")
+    def parallel_goals(self, *goal_args, exit_on_error=True, silent=False):
+        """
+        Run several goal commands concurrently, for example starting algod and kmd
+        """
 
-        self.cmd(
-            f"{goal_path} -d {self.data_dir} {args}",
-            exit_on_error,
-            silent,
-        )
+        async def run_all():
+            return await asyncio.gather(
+                *(self.acmd(self.goal_argv(args), silent) for args in goal_args)
+            )
+
+        for rc in asyncio.run(run_all()):
+            if exit_on_error and rc != 0:
+                exit(rc)
+
+    @contextmanager
+    def open_tarball(self, tarball, stream=True):
+        """
+        Open a gzipped tarball, using rapidgzip for multi-threaded decompression when available
+        """
+        if rapidgzip is None:
+            # Stream mode reads headers as it goes instead of indexing every member first
+            mode = "r|gz" if stream else "r:gz"
+            with open(tarball, "rb", buffering=TAR_COPY_BUFSIZE) as raw:
+                with tarfile.open(
+                    fileobj=raw, mode=mode, copybufsize=TAR_COPY_BUFSIZE
+                ) as f:
+                    yield f
+            return
+
+        mode = "r|" if stream else "r:"
+        with rapidgzip.open(str(tarball), parallelization=0) as gz:
+            with tarfile.open(fileobj=gz, mode=mode, copybufsize=TAR_COPY_BUFSIZE) as f:
+                yield f
 
     def restore_archive(self, tarball, dir):
         with yaspin(text=f"Restoring {tarball} to {dir}"):
-            with tarfile.open(tarball) as f:
-                f.extractall(dir)
+            if tarball.name.endswith(".tar.zst"):
+                with open(tarball, "rb") as raw:
+                    with zstandard.ZstdDecompressor().stream_reader(raw) as z:
+                        with tarfile.open(
+                            fileobj=z, mode="r|", copybufsize=TAR_COPY_BUFSIZE
+                        ) as f:
+                            f.extractall(dir, **TAR_EXTRACT_FILTER)
+                return
+            if self.system_extract(tarball, dir):
+                return
+            with self.open_tarball(tarball) as f:
+                f.extractall(dir, **TAR_EXTRACT_FILTER)
+
+    def system_extract(self, tarball, dir):
+        """
+        Extract a gzipped tarball with the system's tar, decompressing with pigz when it's installed.
+        Returns False if tar isn't available or fails, so the caller can fall back to tarfile
+        """
+        if self.is_windows or shutil.which("tar") is None:
+            return False
+
+        gunzip = "-z" if shutil.which("pigz") is None else "--use-compress-program=pigz"
+        Path(dir).mkdir(parents=True, exist_ok=True)
+        argv = ["tar", gunzip, "-xf", str(tarball), "-C", str(dir)]
+        return subprocess.run(argv, stderr=subprocess.DEVNULL).returncode == 0
 
     def create_tarball(self, tarball, dir):
         with yaspin(text=f"Creating {tarball} from {dir}"):
+            if tarball.name.endswith(".tar.zst"):
+                compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+                with open(tarball, "wb") as raw:
+                    with compressor.stream_writer(raw) as z:
+                        with tarfile.open(
+                            fileobj=z, mode="w|", copybufsize=TAR_COPY_BUFSIZE
+                        ) as tar:
+                            tar.add(dir, arcname=".")
+                return
+            if self.system_archive(tarball, dir):
+                return
+            # The archive is mostly compiled binaries, which barely compress at higher levels
             with tarfile.open(
                 tarball,
                 "w:gz",
+                compresslevel=1,
+                copybufsize=TAR_COPY_BUFSIZE,
             ) as tar:
                 tar.add(dir, arcname=".")
 
+    def system_archive(self, tarball, dir):
+        """
+        Create a gzipped tarball by piping the system's tar into pigz, which compresses on every core.
+        Returns False if either isn't available or fails, so the caller can fall back to tarfile
+        """
+        if self.is_windows:
+            return False
+        if shutil.which("tar") is None or shutil.which("pigz") is None:
+            return False
+
+        with open(tarball, "wb") as out:
+            tar = subprocess.Popen(
+                ["tar", "-cf", "-", "-C", str(dir), "."],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            pigz = subprocess.Popen(
+                ["pigz", "-1"], stdin=tar.stdout, stdout=out, stderr=subprocess.DEVNULL
+            )
+            # Only pigz should hold the read end, so tar sees a broken pipe if pigz exits
+            tar.stdout.close()
+            return (pigz.wait(), tar.wait()) == (0, 0)
+
     def create_localnet(self):
-        template_path = Path.joinpath(self.download_dir, "template.json")
+        template_path = self.download_dir / "template.json"
         shutil.copyfile(
-            Path.joinpath(Path(__file__).resolve().parent, "template.json"),
+            Path(__file__).resolve().parent / "template.json",
             template_path,
         )
 
         self.goal(
-            f'network create --network localnet --template {template_path} --rootdir {Path.joinpath(self.localnet_dir, "data")}'
+            [
+                "network",
+                "create",
+                "--network",
+                "localnet",
+                "--template",
+                template_path,
+                "--rootdir",
+                self.localnet_dir / "data",
+            ]
         )
 
         with yaspin(text="Configuring localnet"):
-            # Temporarily start algod and kmd to generate directories and config files
-            self.goal("node start", silent=True)
-            self.goal("kmd start -t 0", silent=True)
-            self.goal("node stop", silent=True)
-            self.goal("kmd stop", silent=True)
-
+            # Write the config files directly rather than starting algod and kmd to generate them
             self.config()
 
+    def remove_in_background(self, path):
+        """
+        Rename a directory out of the way and delete it on a daemon thread, so exiting doesn't
+        wait for the delete. Trees left behind by an earlier run that exited before deleting them
+        are removed too
+        """
+        try:
+            os.rename(path, path.with_name(f"{path.name}.old.{time.time_ns()}"))
+        except FileNotFoundError:
+            pass
+        except OSError:
+            # For example, Windows won't rename a directory with files that are in use
+            shutil.rmtree(path, ignore_errors=True)
+
+        for old in path.parent.glob(f"{path.name}.old.*"):
+            threading.Thread(
+                target=shutil.rmtree,
+                args=(old,),
+                kwargs={"ignore_errors": True},
+                daemon=True,
+            ).start()
+
+    def find_archive(self, tarball):
+        """
+        Find an archive to restore in place of tarball. If there's no local copy, the
+        gzipped archive is downloaded from the algodeploy mirror. Returns None if neither exists
+        """
+        if tarball.exists():
+            return tarball
+
+        gz_tarball = tarball.with_name(
+            tarball.name.removesuffix(ARCHIVE_SUFFIX) + ".tar.gz"
+        )
+        self.attempt_download(
+            f"https://algodeploy.joe-p.net/{gz_tarball.name}", gz_tarball
+        )
+        return gz_tarball if gz_tarball.exists() else None
+
     def attempt_download(self, url, file):
         try:
             if not file.exists():
@@ -158,84 +486,210 @@ class AlgoDeploy:
                 print(f"Download{url}: {e}")
             pass
 
-    def download_release(self, url, tarball_path):
+    def stream_download_and_extract(self, url, dest, keep=None, sha256=None):
+        """
+        Download a gzipped tarball from a URL and extract it to dest as the data arrives.
+        If keep is given, only members whose name it returns True for are extracted.
+        If sha256 is given, the downloaded bytes are hashed as they arrive and an IOError
+        is raised if they don't match it
+        """
+        # The digest covers the raw asset and gzip is inflated below, so the body must not be
+        # re-encoded
+        with self.session.get(
+            url, headers={"Accept-Encoding": "identity"}, stream=True
+        ) as r, tqdm(
+            unit="B",
+            unit_scale=True,
+            total=int(r.headers.get("Content-Length", 0)) or None,
+            mininterval=0.2,
+            desc=url.split("/")[-1],
+            leave=False,
+        ) as t:
+            r.raise_for_status()
+            digest = hashlib.sha256()
+
+            def received():
+                for chunk in r.iter_content(chunk_size=STREAM_READ_SIZE):
+                    t.update(len(chunk))
+                    digest.update(chunk)
+                    yield chunk
+
+            # Receiving, inflating and untarring each run on their own thread, connected by
+            # bounded queues. zlib and socket reads release the GIL, so the stages overlap
+            with ThreadedReader(received()) as compressed, gzip.GzipFile(
+                fileobj=io.BufferedReader(compressed, STREAM_READ_SIZE)
+            ) as gz, ThreadedReader(
+                iter(lambda: gz.read(STREAM_READ_SIZE), b"")
+            ) as inflated:
+                tar_stream = io.BufferedReader(inflated, STREAM_READ_SIZE)
+                with tarfile.open(
+                    fileobj=tar_stream, mode="r|", copybufsize=TAR_COPY_BUFSIZE
+                ) as f:
+                    members = f if keep is None else (m for m in f if keep(m.name))
+                    self.extract_parallel(f, dest, members)
+
+                if sha256 is None:
+                    return
+                # tarfile stops at the end-of-archive marker, so read the rest to hash all of it
+                for _ in iter(lambda: tar_stream.read(STREAM_READ_SIZE), b""):
+                    pass
+
+            if digest.hexdigest() != sha256.lower():
+                raise IOError(f"{url} doesn't match its sha256 digest")
+
+    def member_parts(self, name):
+        """
+        Split a tar member name into its path components, ignoring a leading "./"
+        """
+        return [part for part in name.split("/") if part not in ("", ".")]
+
+    def keep_release_member(self, name):
+        """
+        Whether a member of a node release tarball is needed by the localnet.
+        data, genesis and test-utils are skipped, as is everything in bin except the node binaries
+        """
+        parts = self.member_parts(name)
+        if not parts:
+            return True
+        if parts[0] in ("data", "genesis", "test-utils"):
+            return False
+        return parts[0] != "bin" or len(parts) == 1 or parts[1] in NODE_BINARIES
+
+    def extract_parallel(self, tar, dest, members=None):
+        """
+        Extract a tarfile, writing and closing regular files from a thread pool.
+        Members are read on the calling thread since tarfile isn't thread-safe.
+        """
+        dest = Path(dest)
+        created_dirs = set()
+        in_flight = threading.Semaphore(EXTRACT_MAX_IN_FLIGHT_MIB)
+
+        def mkdir_p(path):
+            if path not in created_dirs:
+                path.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(path)
+
+        def write_file(path, data, mode, mtime, mib):
+            try:
+                fd = os.open(
+                    path,
+                    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+                    0o600,
+                )
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view) :]
+                    if FD_METADATA:
+                        os.chmod(fd, mode)
+                        # Keep the archive's timestamps so make doesn't see sources as newer
+                        os.utime(fd, (mtime, mtime))
+                finally:
+                    os.close(fd)
+                if not FD_METADATA:
+                    os.chmod(path, mode)
+                    os.utime(path, (mtime, mtime))
+            finally:
+                for _ in range(mib):
+                    in_flight.release()
+
+        with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as pool:
+            futures = []
+            for member in tar if members is None else members:
+                if TAR_EXTRACT_FILTER:
+                    # Apply the same checks extractall(filter="data") would
+                    member = tarfile.data_filter(member, str(dest))
+                path = dest / member.name
+                if member.isdir():
+                    mkdir_p(path)
+                elif member.isfile():
+                    mkdir_p(path.parent)
+                    mib = min(EXTRACT_MAX_IN_FLIGHT_MIB, member.size // 2**20 + 1)
+                    for _ in range(mib):
+                        in_flight.acquire()
+                    data = tar.extractfile(member).read()
+                    futures.append(
+                        pool.submit(
+                            write_file, path, data, member.mode, member.mtime, mib
+                        )
+                    )
+                else:
+                    # Links may point at files that are still being written, so let those
+                    # finish before tarfile creates the link itself
+                    for future in futures:
+                        future.result()
+                    futures.clear()
+                    tar.extract(member, dest, **TAR_EXTRACT_FILTER)
+
+            for future in futures:
+                future.result()
+
+    def download_release(self, url, sha256=None):
         try:
-            self.download_url(url, tarball_path)
+            # Filter members before extraction so unused files are never written
+            self.stream_download_and_extract(
+                url, self.localnet_dir, keep=self.keep_release_member, sha256=sha256
+            )
         except Exception as e:
             print(f"Error downloading {url}: {e}")
+            # Don't leave binaries from a partial or corrupt download behind
+            shutil.rmtree(self.bin_dir, ignore_errors=True)
+            self.bin_dir.mkdir(mode=0o755, parents=True, exist_ok=True)
             return False
 
-        with yaspin(text="Extracting node software"):
-            with tarfile.open(tarball_path) as f:
-                f.extractall(path=self.localnet_dir)
-            shutil.rmtree(Path.joinpath(self.localnet_dir, "data"))
-            shutil.rmtree(Path.joinpath(self.localnet_dir, "genesis"))
-            shutil.rmtree(Path.joinpath(self.localnet_dir, "test-utils"))
-            for exe in self.bin_dir.glob("*"):
-                if exe.name not in ["algod", "goal", "kmd"]:
-                    exe_path = Path.joinpath(self.bin_dir, exe)
-                    exe_path.unlink()
         return True
 
     def create(self, release, no_archive):
         # Stop algod and kmd if they are running to prevent orphaned processes
         self.stop(silent=True)
 
-        version_string = self.get_version(release)  # For example: v3.10.0-stable
-        version = re.findall("\d+\.\d+\.\d+", version_string)[0]  # For example: 3.10.0
-        release_channel = re.findall("-(.*)", version_string)[0]  # For example: stable
-        system = platform.system().lower()
-        machine = platform.machine().lower()
-
-        if machine == "x86_64":
-            machine = "amd64"
+        # For example: v3.10.0-stable
+        version_string = self.cached_version(
+            f"algodeploy_{self.platform_tag}_", release
+        ) or self.get_version(release)
+        # Tags have the form vX.Y.Z-channel. For example: 3.10.0 and stable
+        version, release_channel = version_string.lstrip("v").split("-", 1)
 
-        archive_dir = Path.joinpath(self.algodeploy_dir, "archives")
-        self.data_tarball = Path.joinpath(
-            Path.joinpath(self.algodeploy_dir, "archives"),
-            f"localnet-data_{version_string}.tar.gz",
+        self.data_tarball = (
+            self.archive_dir / f"localnet-data_{version_string}{ARCHIVE_SUFFIX}"
         )
-
-        self.bin_tarball = Path.joinpath(
-            Path.joinpath(self.algodeploy_dir, "archives"),
-            f"algodeploy_{system}-{machine}_{version_string}.tar.gz",
+        self.bin_tarball = (
+            self.archive_dir
+            / f"algodeploy_{self.platform_tag}_{version_string}{ARCHIVE_SUFFIX}"
         )
 
         # remove previous localnet directory for a clean install
-        shutil.rmtree(path=self.localnet_dir, ignore_errors=True)
+        self.remove_in_background(self.localnet_dir)
 
         self.download_dir.mkdir(mode=0o755, parents=True, exist_ok=True)
         self.bin_dir.mkdir(mode=0o755, parents=True, exist_ok=True)
-        archive_dir.mkdir(mode=0o755, parents=True, exist_ok=True)
+        self.archive_dir.mkdir(mode=0o755, parents=True, exist_ok=True)
 
-        self.attempt_download(
-            f"https://algodeploy.joe-p.net/{self.data_tarball.name}",
-            self.data_tarball,
-        )
-        self.attempt_download(
-            f"https://algodeploy.joe-p.net/{self.bin_tarball.name}",
-            self.bin_tarball,
-        )
+        # The data and bin archives are independent, so look for or download them at the same time
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            data_archive, bin_archive = pool.map(
+                self.find_archive, (self.data_tarball, self.bin_tarball)
+            )
 
-        if self.bin_tarball.exists():
-            self.restore_archive(self.bin_tarball, self.bin_dir)
+        if bin_archive is not None:
+            self.restore_archive(bin_archive, self.bin_dir)
         else:
-            tarball = f"node_{release_channel}_{system}-{machine}_{version}.tar.gz"
-            tarball_path = Path.joinpath(self.download_dir, tarball)
+            tarball = f"node_{release_channel}_{self.platform_tag}_{version}.tar.gz"
             aws_url = f"https://algorand-releases.s3.amazonaws.com/channel/{release_channel}/{tarball}"
             gh_url = f"https://github.com/algorand/go-algorand/releases/download/{version_string}/{tarball}"
 
+            sha256 = self.release_digests.get(tarball)
             if not (
-                self.download_release(aws_url, tarball_path)
-                or self.download_release(gh_url, tarball_path)
+                self.download_release(aws_url, sha256)
+                or self.download_release(gh_url, sha256)
             ):
                 self.build_from_source(version_string)
 
             if not no_archive:
                 self.create_tarball(self.bin_tarball, self.bin_dir)
 
-        if self.data_tarball.exists():
-            self.restore_archive(self.data_tarball, self.data_dir)
+        if data_archive is not None:
+            self.restore_archive(data_archive, self.data_dir)
         else:
             self.create_localnet()
         if not no_archive:
@@ -243,54 +697,329 @@ class AlgoDeploy:
 
         self.start()
 
-    def download_url(self, url, output_path):
+    def download_url(self, url, output_path, sha256=None):
+        """
+        Download a file from a URL to a specified path with a progress bar.
+        If the server supports range requests, the file is split into chunks
+        that are downloaded in parallel, and an interrupted single-connection download
+        is resumed from where it stopped. Returns the response to the initial HEAD request.
+
+        The download is checked against the server's Content-Length and, if given, the
+        sha256 hex digest. A file that fails the check is deleted and downloaded once more
+        """
+        for _ in range(2):
+            head = self.download_once(url, output_path)
+            size = int(head.headers.get("Content-Length", 0))
+            if self.verify_file(output_path, size, sha256):
+                return head
+            output_path.unlink()
+
+        raise IOError(f"{output_path.name} from {url} failed verification")
+
+    def verify_file(self, path, size=0, sha256=None):
+        """
+        Check that a file has the expected size and sha256 hex digest. Either check is skipped if not given
+        """
+        if size and path.stat().st_size != size:
+            return False
+        if sha256 is None:
+            return True
+        with open(path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):
+                digest = hashlib.file_digest(f, "sha256")
+            else:
+                # hashlib.file_digest is only available from Python 3.11
+                digest = hashlib.sha256()
+                for block in iter(lambda: f.read(DOWNLOAD_BLOCK_SIZE), b""):
+                    digest.update(block)
+        return digest.hexdigest() == sha256.lower()
+
+    def download_once(self, url, output_path):
         """
-        Download a file from a URL to a specified path with a progress bar
+        Download url to output_path without verifying it. Returns the response to the HEAD request
         """
-        with DownloadProgressBar(
-            unit="B", unit_scale=True, miniters=1, desc=url.split("/")[-1], leave=False
+        # Ask for the unencoded size, since that's what gets downloaded
+        head = self.session.head(
+            url, headers={"Accept-Encoding": "identity"}, allow_redirects=True
+        )
+        head.raise_for_status()
+        size = int(head.headers.get("Content-Length", 0))
+        accepts_ranges = head.headers.get("Accept-Ranges", "").lower() == "bytes"
+
+        # Data is written to a .part file that only replaces output_path once it's complete
+        partial_path = output_path.with_name(f"{output_path.name}.part")
+        try:
+            offset = partial_path.stat().st_size
+        except FileNotFoundError:
+            offset = 0
+        if size and offset == size:
+            # The download finished but was interrupted before the rename. download_url
+            # verifies it like any other download and fetches it again if that fails
+            os.replace(partial_path, output_path)
+            return head
+        resume = accepts_ranges and 0 < offset < size
+
+        with tqdm(
+            unit="B",
+            unit_scale=True,
+            mininterval=0.2,
+            desc=url.split("/")[-1],
+            leave=False,
         ) as t:
-            urllib.request.urlretrieve(
-                url, filename=output_path, reporthook=t.update_to
+            if resume or not accepts_ranges or size <= DOWNLOAD_CHUNK_SIZE:
+                t.total = size or None
+                self.download_stream(
+                    head.url, partial_path, t, offset=offset if resume else 0
+                )
+            else:
+                t.total = size
+                # Use the final URL so each ranged request doesn't repeat the redirects
+                try:
+                    self.download_ranges(head.url, partial_path, size, t)
+                except RangeIgnoredError:
+                    # Some servers advertise ranges but send the whole body anyway
+                    t.reset(total=size)
+                    self.download_stream(head.url, partial_path, t)
+
+        os.replace(partial_path, output_path)
+        return head
+
+    def download_if_modified(self, url, output_path):
+        """
+        Download a file unless the copy at output_path still matches the server's ETag
+        """
+        etag_path = output_path.with_name(f"{output_path.name}.etag")
+        if output_path.exists() and etag_path.exists():
+            etag = etag_path.read_text()
+            r = self.session.head(
+                url, headers={"If-None-Match": etag}, allow_redirects=True
             )
+            if r.status_code == 304 or r.headers.get("ETag") == etag:
+                return
+
+        etag_path.unlink(missing_ok=True)
+        head = self.download_url(url, output_path)
+        if "ETag" in head.headers:
+            etag_path.write_text(head.headers["ETag"])
 
-    def get_version(self, match):
+    def download_stream(self, url, output_path, t, offset=0):
+        """
+        Download url to output_path over a single connection.
+        If offset is given, the download resumes by appending from that byte
         """
-        Get the latest release from github that matches match
+        headers = {"Accept-Encoding": "identity"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+
+        with self.session.get(url, headers=headers, stream=True) as r:
+            r.raise_for_status()
+            # A 200 means the server ignored the range, so start over
+            resumed = offset and r.status_code == 206
+            if resumed:
+                t.update(offset)
+            with open(output_path, "ab" if resumed else "wb") as f:
+                for block in r.iter_content(chunk_size=DOWNLOAD_BLOCK_SIZE):
+                    f.write(block)
+                    t.update(len(block))
+
+    def download_ranges(self, url, output_path, size, t):
         """
+        Download url to output_path using parallel ranged GET requests.
+        RangeIgnoredError is raised if the server doesn't answer a request with its range
+        """
+        lock = threading.Lock()
+        # Set once a chunk fails, so the other workers stop instead of fetching the rest
+        failed = threading.Event()
+
+        def download_chunk(f, start, end):
+            if failed.is_set():
+                return
+            # Ranges refer to the raw bytes, so the body must not be re-encoded
+            headers = {"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+            with self.session.get(url, headers=headers, stream=True) as r:
+                r.raise_for_status()
+                if r.status_code != 206:
+                    raise RangeIgnoredError(
+                        f"{url} answered bytes={start}-{end} with {r.status_code}"
+                    )
+                offset = start
+                for block in r.iter_content(chunk_size=DOWNLOAD_BLOCK_SIZE):
+                    if failed.is_set():
+                        return
+                    self.write_at(f, block, offset, lock)
+                    offset += len(block)
+                    with lock:
+                        t.update(len(block))
+
+        try:
+            with open(output_path, "wb") as f, ThreadPoolExecutor(
+                max_workers=DOWNLOAD_WORKERS
+            ) as pool:
+                f.truncate(size)
+                futures = [
+                    pool.submit(
+                        download_chunk,
+                        f,
+                        start,
+                        min(start + DOWNLOAD_CHUNK_SIZE, size) - 1,
+                    )
+                    for start in range(0, size, DOWNLOAD_CHUNK_SIZE)
+                ]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except BaseException:
+                    failed.set()
+                    for future in futures:
+                        future.cancel()
+                    raise
+        except BaseException:
+            # The file was preallocated, so its size doesn't say how much was written
+            output_path.unlink(missing_ok=True)
+            raise
+
+    def write_at(self, f, data, offset, lock):
+        """
+        Write data at offset in a file shared between threads. os.pwrite doesn't move the file
+        position, so no locking is needed where it's available. Elsewhere, seek and write under lock
+        """
+        if not hasattr(os, "pwrite"):
+            with lock:
+                f.seek(offset)
+                f.write(data)
+            return
+
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(f.fileno(), view, offset)
+            view = view[written:]
+            offset += written
+
+    def cached_version(self, prefix, match, max_age=24 * 60 * 60):
+        """
+        Get the release of the newest archive named prefix + release that matches match,
+        so a repeated create doesn't need the GitHub API. Archives older than max_age
+        seconds are ignored, so new releases are still picked up
+        """
+        newest = None
+        for path in self.archive_dir.glob(f"{prefix}v*.tar.*"):
+            version_string, _, compression = path.name[len(prefix) :].partition(".tar.")
+            # zstd archives can only be opened with zstandard installed
+            readable = ("gz",) if zstandard is None else ("gz", "zst")
+            if compression not in readable or match not in version_string:
+                continue
+            mtime = path.stat().st_mtime
+            if time.time() - mtime < max_age and (newest is None or mtime > newest[0]):
+                newest = (mtime, version_string)
+
+        return None if newest is None else newest[1]
+
+    def get_version(self, match, ttl=300):
+        """
+        Get the latest release from github that matches match.
+        The tag and asset digests found for match are cached on disk for ttl seconds,
+        so a repeated call doesn't load and search the whole releases document again
+        """
+        key = hashlib.sha1(match.encode()).hexdigest()
+        version_path = self.cache_dir / f"version_{key}.json"
+        try:
+            if time.time() - version_path.stat().st_mtime < ttl:
+                with open(version_path, "rb") as f:
+                    version = json_loads(f.read())
+                self.release_digests = version["digests"]
+                return version["tag_name"]
+        except FileNotFoundError:
+            pass
+
         with yaspin(text="Getting latest node version"):
-            releases = requests.get(
+            releases = self.cached_get(
                 "https://api.github.com/repos/algorand/go-algorand/releases"
-            ).json()
-            for release in releases:
-                if match in release["tag_name"]:
-                    return release["tag_name"]
+            )
+            release = next((r for r in releases if match in r["tag_name"]), None)
+            if release is None:
+                return None
+
+            # GitHub publishes a "sha256:<hex>" digest for each release asset
+            self.release_digests = {
+                asset["name"]: asset["digest"].removeprefix("sha256:")
+                for asset in release.get("assets", [])
+                if (asset.get("digest") or "").startswith("sha256:")
+            }
+            self.replace_file(
+                version_path,
+                json_dumps(
+                    {"tag_name": release["tag_name"], "digests": self.release_digests}
+                ),
+            )
+            return release["tag_name"]
+
+    def cached_get(self, url, ttl=600):
+        """
+        GET a JSON document, caching it on disk for ttl seconds and revalidating it with its ETag afterwards
+        """
+        self.cache_dir.mkdir(mode=0o755, parents=True, exist_ok=True)
+        key = hashlib.sha1(url.encode()).hexdigest()
+        body_path = self.cache_dir / f"{key}.json"
+        etag_path = self.cache_dir / f"{key}.etag"
+
+        headers = {}
+        if body_path.exists():
+            if time.time() - body_path.stat().st_mtime < ttl:
+                with open(body_path, "rb") as f:
+                    return json_loads(f.read())
+            if etag_path.exists():
+                with open(etag_path, "r") as f:
+                    headers["If-None-Match"] = f.read()
+
+        r = self.session.get(url, headers=headers)
+        if r.status_code == 304:
+            body_path.touch()
+            with open(body_path, "rb") as f:
+                return json_loads(f.read())
+
+        r.raise_for_status()
+        # Drop the old ETag first so it can never be paired with a newer body
+        etag_path.unlink(missing_ok=True)
+        self.replace_file(body_path, r.content)
+        if "ETag" in r.headers:
+            self.replace_file(etag_path, r.headers["ETag"].encode())
+        return json_loads(r.content)
 
     # https://stackoverflow.com/a/57970619
-    def cmd(self, cmd_str, exit_on_error=True, silent=False):
+    def cmd(self, argv, exit_on_error=True, silent=False, env=None):
         """
-        Execute a system command with realtime output
+        Execute a system command with realtime output. argv is passed to the OS directly, without a shell.
+        If env is given, it replaces the environment of the command
         """
+        argv = [str(arg) for arg in argv]
         if not silent:
-            print(f"+ {cmd_str}")
-
-        process = subprocess.Popen(
-            cmd_str,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            shell=True,
-            encoding="utf-8",
-            errors="replace",
-        )
-
-        while True:
-            realtime_output = process.stdout.readline()
+            print(f"+ {shlex.join(argv)}")
 
-            if realtime_output == "" and process.poll() is not None:
-                break
+        try:
+            # Silent output is discarded by the OS instead of being read and dropped
+            process = subprocess.Popen(
+                argv,
+                stdout=subprocess.DEVNULL if silent else subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=0,
+                env=env,
+            )
+        except FileNotFoundError as e:
+            # Match the shell's exit code for a missing executable
+            if not silent:
+                print(e, flush=True)
+            if exit_on_error:
+                exit(127)
+            return 127
 
-            if not silent and realtime_output:
-                print(realtime_output.strip(), flush=True)
+        if not silent:
+            # Pass whatever output is available straight through as bytes, without decoding it
+            sys.stdout.flush()
+            fd = process.stdout.fileno()
+            with process.stdout:
+                for data in iter(lambda: os.read(fd, CMD_READ_SIZE), b""):
+                    sys.stdout.buffer.write(data)
+                    sys.stdout.buffer.flush()
 
         rc = process.wait()
         if exit_on_error and rc != 0:
@@ -298,6 +1027,36 @@ class AlgoDeploy:
 
         return rc
 
+    async def acmd(self, argv, silent=False):
+        """
+        Execute a command without a shell, printing its output as it arrives
+        """
+        argv = [str(arg) for arg in argv]
+        if not silent:
+            print(f"+ {shlex.join(argv)}")
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=(
+                    asyncio.subprocess.DEVNULL if silent else asyncio.subprocess.PIPE
+                ),
+                stderr=asyncio.subprocess.STDOUT,
+            )
+        except FileNotFoundError as e:
+            # Match the shell's exit code for a missing executable
+            if not silent:
+                print(e, flush=True)
+            return 127
+
+        if silent:
+            return await process.wait()
+
+        async for line in process.stdout:
+            print(line.decode("utf-8", errors="replace").strip(), flush=True)
+
+        return await process.wait()
+
     def msys_cmd(self, cmd_str, exit_on_error=True, silent=False):
         """
         On Windows, execute a command with realtime output in a msys2/MINGW64 shell
@@ -306,13 +1065,29 @@ class AlgoDeploy:
         cmd_str = cmd_str.replace("\\", "/")
         cmd_str = cmd_str.replace("C:", "/c")
 
-        env_path = Path.joinpath(self.msys_dir, "usr/bin/env.exe")
+        if self.msys_env is None:
+            # Set up the MINGW64 environment that a login shell's profile would, but only once
+            path = [self.msys_dir / "mingw64/bin", self.msys_dir / "usr/bin"]
+            self.msys_env = {
+                **os.environ,
+                "MSYSTEM": "MINGW64",
+                "PATH": os.pathsep.join([*map(str, path), os.environ.get("PATH", "")]),
+            }
+
+        # Run bash directly as a non-login shell so /etc/profile isn't sourced every time
         self.cmd(
-            f'{env_path} MSYSTEM=MINGW64 /usr/bin/bash -lc "{cmd_str}"',
+            [self.msys_dir / "usr/bin/bash.exe", "-c", cmd_str],
             exit_on_error,
             silent,
+            env=self.msys_env,
         )
 
+    def shell_cmd(self, cmd_str, exit_on_error=True, silent=False):
+        """
+        Execute a command with realtime output in a POSIX shell
+        """
+        self.cmd(["/bin/sh", "-c", cmd_str], exit_on_error, silent)
+
     def prompt(self, text):
         reply = None
         while reply not in ("y", "n"):
@@ -320,76 +1095,143 @@ class AlgoDeploy:
         return reply == "y"
 
     def build_from_source(self, tag):
-        cmd_function = self.cmd
+        cmd_function = self.shell_cmd
 
-        if platform.system() == "Windows":
+        # Records the directory the source of a tag was extracted to, so re-runs can reuse it
+        extracted_marker = self.download_dir / f"{tag}.extracted"
+        src_dir = None
+        if extracted_marker.exists():
+            src_dir = self.download_dir / extracted_marker.read_text()
+            if not src_dir.is_dir():
+                src_dir = None
+
+        if self.is_windows:
             # Install msys2 if it's not already installed.
             # Home directory the install path in case user isn't admin
-            if not Path.joinpath(self.msys_dir, "usr/bin/env.exe").is_file():
-                if not self.prompt(f"Install msys2 to {self.msys_dir}?"):
-                    exit()
-
-                installer_path = Path.joinpath(
-                    self.download_dir, "msys2-x86_64-20220904.exe"
+            install_msys = not (self.msys_dir / "usr/bin/env.exe").is_file()
+            if install_msys and not self.prompt(f"Install msys2 to {self.msys_dir}?"):
+                exit()
+
+        # Download archive of given tag from github while the toolchain is set up. A daemon
+        # thread is used so exiting on a failed toolchain step doesn't wait for the download,
+        # which leaves a .part file that the next run resumes
+        tarball_path = self.download_dir / f"{tag}.tar.gz"
+        source_errors = []
+
+        def download_source():
+            try:
+                self.download_if_modified(
+                    f"https://github.com/algorand/go-algorand/archive/{tag}.tar.gz",
+                    tarball_path,
+                )
+            except Exception as e:
+                source_errors.append(e)
+
+        source_download = None
+        if src_dir is None:
+            source_download = threading.Thread(target=download_source, daemon=True)
+            source_download.start()
+
+        if self.is_windows:
+            downloads = []
+            if install_msys:
+                installer_path = self.download_dir / "msys2-x86_64-20220904.exe"
+                downloads.append(
+                    (
+                        "https://github.com/msys2/msys2-installer/releases/download/2022-09-04/msys2-x86_64-20220904.exe",
+                        installer_path,
+                    )
                 )
-                self.download_url(
-                    "https://github.com/msys2/msys2-installer/releases/download/2022-09-04/msys2-x86_64-20220904.exe",
-                    installer_path,
+
+            # Download and install go package from mirror because pacman can sometimes be slow
+            go_pkg = self.download_dir / "mingw-w64-x86_64-go-1.19-1-any.pkg.tar.zst"
+            downloads.append(
+                (
+                    "https://mirror.msys2.org/mingw/mingw64/mingw-w64-x86_64-go-1.19-1-any.pkg.tar.zst",
+                    go_pkg,
                 )
+            )
+
+            # The installer and go package are independent, so fetch them at the same time
+            with ThreadPoolExecutor(max_workers=len(downloads)) as pool:
+                futures = [
+                    pool.submit(self.download_url, url, path) for url, path in downloads
+                ]
+                for future in futures:
+                    future.result()
+
+            if install_msys:
                 self.cmd(
-                    f"{installer_path} install --root {self.msys_dir} --confirm-command"
+                    [
+                        installer_path,
+                        "install",
+                        "--root",
+                        self.msys_dir,
+                        "--confirm-command",
+                    ]
                 )
 
             cmd_function = self.msys_cmd
             # pacman can sometimes hang when checking space in msys2 shell, so it has been disabled
             cmd_function("sed -i 's/^CheckSpace/#CheckSpace/g' /etc/pacman.conf")
-
-            # Download and install go package from mirror because pacman can sometimes be slow
-            go_pkg = Path.joinpath(
-                self.download_dir, "mingw-w64-x86_64-go-1.19-1-any.pkg.tar.zst"
-            )
-            self.download_url(
-                "https://mirror.msys2.org/mingw/mingw64/mingw-w64-x86_64-go-1.19-1-any.pkg.tar.zst",
-                go_pkg,
-            )
             cmd_function(f"pacman -U --noconfirm --needed {go_pkg}")
 
-        # Download archive of given tag from github
-        tarball_path = Path.joinpath(self.download_dir, f"{tag}.tar.gz")
-        self.download_url(
-            f"https://github.com/algorand/go-algorand/archive/{tag}.tar.gz",
-            tarball_path,
-        )
-
-        tarball = tarfile.open(tarball_path)
-
-        # Get the name of the directory that the archive will extract to and remove it if it exists
-        src_dir = Path.joinpath(self.download_dir, Path(tarball.getnames()[0]).name)
-        shutil.rmtree(path=src_dir, ignore_errors=True)
+        if source_download is not None:
+            source_download.join()
+            if source_errors:
+                raise source_errors[0]
+
+        if src_dir is None:
+            with self.open_tarball(tarball_path) as tarball:
+                # Get the name of the directory that the archive will extract to from its
+                # first member and remove it if it exists
+                members = iter(tarball)
+                first = next(members)
+                src_dir = self.download_dir / first.name.split("/", 1)[0]
+                shutil.rmtree(path=src_dir, ignore_errors=True)
+
+                self.extract_parallel(
+                    tarball, self.download_dir, itertools.chain([first], members)
+                )
 
-        tarball.extractall(path=self.download_dir)
-        tarball.close()
+            extracted_marker.write_text(src_dir.name)
 
         cmd_function(f"cd {src_dir} && GOPATH=$HOME/go ./scripts/configure_dev.sh")
-        cmd_function(f"cd {src_dir} && GOPATH=$HOME/go make")
+        # Let make run independent targets in parallel. Go already compiles packages in parallel
+        jobs = os.cpu_count() or 1
+        cmd_function(f"cd {src_dir} && GOPATH=$HOME/go MAKEFLAGS=-j{jobs} make")
 
         for bin in ["algod", "goal", "kmd", "tealdbg"]:
-            if platform.system() == "Windows":
-                bin_path = Path.joinpath(
-                    self.msys_dir,
-                    "home",
-                    self.home_dir.name,
-                    "go",
-                    "bin",
-                    f"{bin}.exe",
-                )
+            if self.is_windows:
+                go_bin_dir = self.msys_dir / "home" / self.home_dir.name / "go" / "bin"
+                bin_path = go_bin_dir / f"{bin}.exe"
             else:
-                bin_path = Path.joinpath(self.home_dir, "go", "bin", bin)
+                bin_path = self.home_dir / "go" / "bin" / bin
 
-            shutil.copyfile(
-                bin_path,
-                Path.joinpath(self.bin_dir, bin_path.name),
-            )
+            self.link_or_copy(bin_path, self.bin_dir / bin_path.name)
+
+    def link_or_copy(self, src, dst):
+        """
+        Hard link src to dst so no data is copied, falling back to a reflink and then a copy
+        """
+        # os.link won't replace an existing file
+        dst.unlink(missing_ok=True)
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+
+        if fcntl is not None:
+            try:
+                with open(src, "rb") as s, open(dst, "wb") as d:
+                    fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+                return
+            except OSError:
+                pass
+
+        # copyfile uses copy_file_range/sendfile where the OS supports them
+        shutil.copyfile(src, dst)
 
 
 if __name__ == "__main__":